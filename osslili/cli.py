@@ -8,12 +8,12 @@ from pathlib import Path
 from typing import Optional
 
 import click
-import yaml
 from colorama import init, Fore, Style
 
 from . import __version__
 from .core.models import Config
 from .core.generator import LicenseCopyrightDetector
+from .utils.config_loader import ConfigLoader
 from .utils.logging import setup_logging
 
 init(autoreset=True)
@@ -45,14 +45,7 @@ def load_config(config_path: Optional[str]) -> Config:
         return Config()
     
     try:
-        with open(config_path, 'r') as f:
-            config_data = yaml.safe_load(f)
-        
-        config = Config()
-        for key, value in config_data.items():
-            if hasattr(config, key):
-                setattr(config, key, value)
-        
+        config = ConfigLoader.load_from_file(config_path)
         print_info(f"Loaded configuration from {config_path}")
         return config
     except Exception as e:
@@ -303,7 +296,7 @@ def main(
         
         # Write output
         if output:
-            with open(output, 'w') as f:
+            with open(output, 'w', encoding='utf-8') as f:
                 f.write(output_data)
             print_success(f"Detection results written to {output}")
         else:
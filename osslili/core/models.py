@@ -3,6 +3,7 @@ Data models for the semantic-copycat-oslili package.
 """
 
 from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import List, Optional, Dict, Any
 from enum import Enum
 
@@ -25,6 +26,9 @@ class LicenseCategory(Enum):
     REFERENCED = "referenced"  # Mentioned but not primary
 
 
+_by_confidence = attrgetter('confidence')
+
+
 @dataclass
 class DetectedLicense:
     """Represents a detected license."""
@@ -84,7 +88,7 @@ class DetectionResult:
         """Get the license with highest confidence."""
         if not self.licenses:
             return None
-        return max(self.licenses, key=lambda x: x.confidence)
+        return max(self.licenses, key=_by_confidence)
     
     def to_dict(self) -> Dict[str, Any]:
         return {
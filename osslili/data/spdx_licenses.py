@@ -328,25 +328,27 @@ class SPDXLicenseData:
         Returns:
             License text or None
         """
-        # Check memory cache
-        if license_id in self._license_texts:
-            return self._license_texts[license_id]
+        # Check memory cache, which also remembers licenses without text
+        if license_id not in self._license_texts:
+            self._license_texts[license_id] = self._load_license_text(license_id)
+        return self._license_texts[license_id]
+    
+    def _load_license_text(self, license_id: str) -> Optional[str]:
+        """Load license text from bundled data, the file cache or the network."""
+        if self._licenses is None:
+            self._load_licenses()
         
         # Check bundled data first
         if self._bundled_data and license_id in self._bundled_data.get("licenses", {}):
             bundled_license = self._bundled_data["licenses"][license_id]
             if "text" in bundled_license and bundled_license["text"]:
-                text = bundled_license["text"]
-                self._license_texts[license_id] = text
-                return text
+                return bundled_license["text"]
         
         # Check file cache
         text_file = self.license_texts_dir / f"{license_id}.txt"
         if text_file.exists():
             with open(text_file, 'r') as f:
-                text = f.read()
-                self._license_texts[license_id] = text
-                return text
+                return f.read()
         
         # Download license details as last resort
         license_info = self.get_license_info(license_id)
@@ -369,7 +371,6 @@ class SPDXLicenseData:
             if text:
                 with open(text_file, 'w') as f:
                     f.write(text)
-                self._license_texts[license_id] = text
                 return text
         
         except Exception as e:
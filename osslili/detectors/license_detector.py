@@ -5,9 +5,14 @@ License detection module with multi-tier detection system.
 import logging
 import re
 import fnmatch
+import hashlib
+import operator
+import threading
 import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from dataclasses import replace
 from pathlib import Path
-from typing import List, Optional, Set
+from typing import Dict, List, Optional, Set
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from fuzzywuzzy import fuzz
@@ -15,13 +20,20 @@ from fuzzywuzzy import fuzz
 from ..core.models import DetectedLicense, DetectionMethod, LicenseCategory
 from ..core.input_processor import InputProcessor
 from ..data.spdx_licenses import SPDXLicenseData
-from .tlsh_detector import TLSHDetector
+from .tlsh_detector import LICENSE_NAME_HINTS, TLSHDetector
 from ..utils.file_scanner import SafeFileScanner
 from ..utils.license_normalizer import LicenseNormalizer
 from ..utils.regex_matcher import RegexPatternMatcher
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of text detection results kept in memory per detector
+DETECTION_CACHE_SIZE = 10000
+
+# Large non-license files are only read in full if this much of their start
+# shows license-related text
+LICENSE_PREFIX_SIZE = 64 * 1024
+
 
 class LicenseDetector:
     """Detect licenses in source code using multiple detection methods."""
@@ -45,15 +57,28 @@ class LicenseDetector:
         # License filename patterns
         self.license_patterns = self._compile_filename_patterns()
         
-        # SPDX tag patterns
-        self.spdx_tag_patterns = self._compile_spdx_patterns()
+        # SPDX tag patterns (single combined regex)
+        self.spdx_tag_pattern = self._compile_spdx_patterns()
         
-        # Common license indicators in text
+        # Common license indicators in text, most frequent first so that
+        # _contains_license_text can stop at the first hit
         self.license_indicators = [
-            'licensed under', 'license', 'copyright', 'permission is hereby granted',
-            'redistribution and use', 'all rights reserved', 'this software is provided',
-            'warranty', 'as is', 'merchantability', 'fitness for a particular purpose'
+            'license', 'copyright', 'warranty', 'as is', 'permission is hereby granted',
+            'licensed under', 'all rights reserved', 'redistribution and use',
+            'this software is provided', 'merchantability', 'fitness for a particular purpose'
         ]
+
+        # Bigram sets of the reference license texts, built on first Dice-Sørensen use
+        self._license_bigrams: Optional[Dict[str, Set[str]]] = None
+
+        # License-file classification by file name; it's asked for several times
+        # per file (reading, tier selection, categorizing every detection)
+        self._license_file_names: Dict[str, bool] = {}
+
+        # Text detection results keyed by (file name, content digest); duplicate
+        # LICENSE files and repeated boilerplate headers are only matched once
+        self._detection_cache: "OrderedDict[tuple, Optional[DetectedLicense]]" = OrderedDict()
+        self._detection_cache_lock = threading.Lock()
     
     def _categorize_license(self, file_path: Path, detection_method: str, match_type: str = None) -> tuple[str, str]:
         """
@@ -70,9 +95,7 @@ class LicenseDetector:
             return LicenseCategory.DECLARED.value, "license_file"
         
         # Package metadata files
-        if file_name in ['package.json', 'setup.py', 'setup.cfg', 'pyproject.toml',
-                         'cargo.toml', 'pom.xml', 'build.gradle', 'composer.json'] or \
-           file_name.endswith('.gemspec') or file_name.endswith('.nuspec'):
+        if self._is_package_metadata_name(file_name):
             return LicenseCategory.DECLARED.value, "package_metadata"
         
         # SPDX tags in any file are considered declared
@@ -82,7 +105,7 @@ class LicenseDetector:
         # References in source code comments or documentation
         if detection_method == DetectionMethod.REGEX.value:
             # Check if it's in documentation
-            if any(ext in file_name for ext in ['.md', '.rst', '.txt', '.adoc']):
+            if self._is_documentation_name(file_name):
                 return LicenseCategory.DECLARED.value, "documentation"
             # Check if it's a full license header vs. brief reference
             # match_type gets passed with information about how many patterns matched
@@ -100,6 +123,31 @@ class LicenseDetector:
         # Default to detected for unknown cases
         return LicenseCategory.DETECTED.value, match_type or "unknown"
 
+    def _is_package_metadata_name(self, file_name: str) -> bool:
+        """Check if a lowercased file name is a package metadata file."""
+        return (file_name in ['package.json', 'setup.py', 'setup.cfg', 'pyproject.toml',
+                              'cargo.toml', 'pom.xml', 'build.gradle', 'composer.json'] or
+                file_name.endswith('.gemspec') or file_name.endswith('.nuspec'))
+
+    def _is_documentation_name(self, file_name: str) -> bool:
+        """Check if a lowercased file name looks like documentation."""
+        return any(ext in file_name for ext in ['.md', '.rst', '.txt', '.adoc'])
+
+    def _categorization_key(self, file_path: Path) -> tuple:
+        """
+        Get the file name facts that categorization depends on.
+
+        Files that agree on all of them get the same category and match type
+        for the same text, so detection results can be shared between them.
+        """
+        file_name = file_path.name.lower()
+        return (
+            self._is_license_file(file_path),
+            self._is_package_metadata_name(file_name),
+            self._is_documentation_name(file_name),
+            any(hint in file_name for hint in LICENSE_NAME_HINTS),
+        )
+
     def _is_valid_license_id(self, license_id: str) -> bool:
         """Validate that detected license ID is actually a license."""
         if not license_id or not isinstance(license_id, str):
@@ -203,30 +251,43 @@ class LicenseDetector:
         return patterns
     
     
-    def _compile_spdx_patterns(self) -> List[re.Pattern]:
-        """Compile SPDX identifier patterns."""
-        return [
+    def _compile_spdx_patterns(self) -> re.Pattern:
+        """
+        Compile SPDX identifier patterns into a single alternation.
+
+        Each alternative has exactly one capturing group, so ``match.lastindex``
+        identifies which pattern matched. Per-pattern MULTILINE semantics are kept
+        with scoped inline flags, and the leading lookahead lets the engine skip
+        positions that cannot start any alternative.
+
+        Unlike separate per-pattern scans, a single scan does not report matches
+        that overlap an earlier one: in ``SPDX-License-Identifier: MIT @license
+        Apache`` only the SPDX tag is found, since the ``@license`` text is
+        already consumed by it.
+        """
+        patterns = [
             # SPDX-License-Identifier: <license>
             # Match complex expressions including parentheses, AND, OR, WITH
             # Stop at newline or end of comment markers
-            re.compile(r'SPDX-License-Identifier:\s*([^\n]+?)(?:\s*\*/)?(?:\s*-->)?$', re.IGNORECASE | re.MULTILINE),
+            r'(?m:SPDX-License-Identifier:\s*([^\n]+?)(?:\s*\*/)?(?:\s*-->)?$)',
             # Python METADATA: License-Expression: <license>
-            re.compile(r'License-Expression:\s*([^\s\n]+)', re.IGNORECASE),
+            r'(?:License-Expression:\s*([^\s\n]+))',
             # package.json style: "license": "MIT" or licenses array with "type": "MIT"
-            re.compile(r'"license"\s*:\s*"([^"]+)"', re.IGNORECASE),
+            r'(?:"license"\s*:\s*"([^"]+)")',
             # package.json licenses array: {"type": "MIT", ...}
-            re.compile(r'"type"\s*:\s*"([^"]+)"', re.IGNORECASE),
+            r'(?:"type"\s*:\s*"([^"]+)")',
             # pyproject.toml style: license = {text = "Apache-2.0"}
-            re.compile(r'license\s*=\s*\{[^}]*text\s*=\s*"([^"]+)"', re.IGNORECASE),
+            r'(?:license\s*=\s*\{[^}]*text\s*=\s*"([^"]+)")',
             # pyproject.toml style: license = "MIT"
-            re.compile(r'^\s*license\s*=\s*"([^"]+)"', re.IGNORECASE | re.MULTILINE),
+            r'(?m:^\s*license\s*=\s*"([^"]+)")',
             # General License: <license> (but more restrictive to avoid false positives)
-            re.compile(r'^\s*License:\s*([A-Za-z0-9\-\.]+)', re.IGNORECASE | re.MULTILINE),
+            r'(?m:^\s*License:\s*([A-Za-z0-9\-\.]+))',
             # @license <license>
-            re.compile(r'@license\s+([A-Za-z0-9\-\.]+)', re.IGNORECASE),
+            r'(?:@license\s+([A-Za-z0-9\-\.]+))',
             # Licensed under <license> - Fixed to capture full license name
-            re.compile(r'[Ll]icensed\s+under\s+(?:the\s+)?([A-Za-z0-9\-\.\s]+?)(?:\s+[Ll]icense)?(?:[,\n;]|$)', re.IGNORECASE),
+            r'(?:[Ll]icensed\s+under\s+(?:the\s+)?([A-Za-z0-9\-\.\s]+?)(?:\s+[Ll]icense)?(?:[,\n;]|$))',
         ]
+        return re.compile(r'(?m:(?=[sl"@]|^))(?:' + '|'.join(patterns) + ')', re.IGNORECASE)
     
     def detect_licenses(self, path: Path) -> List[DetectedLicense]:
         """
@@ -329,6 +390,8 @@ class LicenseDetector:
             for pattern in self.license_patterns:
                 if pattern.match(file_path.name):
                     license_files_set.add(file_path)
+                    # A pattern match also settles _is_license_file for this name
+                    self._license_file_names[file_path.name] = True
                     break  # No need to check other patterns for this file
 
             # If not already added, check fuzzy match
@@ -653,17 +716,35 @@ class LicenseDetector:
         licenses = []
         
         # Read file content - for large files, read in chunks
-        file_size = file_path.stat().st_size if file_path.exists() else 0
-        
-        # For very large files (>10MB), only read the beginning and end
+        try:
+            file_size = file_path.stat().st_size
+        except OSError:
+            file_size = 0
+
+        is_license_file = self._is_license_file(file_path)
+
+        # For very large files (>10MB), only read the beginning and end. The
+        # sample is already bounded and may carry a license only in its tail,
+        # so it skips the prefix check below
         if file_size > 10 * 1024 * 1024:  # 10MB
             content = self._read_file_smart(file_path)
         else:
+            # For large files that aren't license files, check the beginning for
+            # license indicators before paying for a full read
+            if (file_size > LICENSE_PREFIX_SIZE and not single_file_mode
+                    and not is_license_file):
+                prefix = self.input_processor.read_text_file(file_path, max_size=LICENSE_PREFIX_SIZE)
+                if not prefix or not self._contains_license_text(prefix):
+                    return licenses
+
             # For smaller files, read the whole thing
             content = self.input_processor.read_text_file(file_path, max_size=file_size if file_size > 0 else 10*1024*1024)
         
         if not content:
             return licenses
+
+        # Lowercase once and share it with every case-insensitive check below
+        content_lower = content.lower()
         
         # Method 0: Extract from package metadata files first (highest priority)
         metadata_licenses = self._extract_package_metadata(content, file_path)
@@ -674,21 +755,21 @@ class LicenseDetector:
         licenses.extend(tag_licenses)
 
         # Method 2: Detect license keywords (base licenses) with enhanced patterns
-        keyword_licenses = self._detect_license_keywords(content, file_path)
+        keyword_licenses = self._detect_license_keywords(content, file_path, content_lower)
         licenses.extend(keyword_licenses)
 
         # Method 3: Apply full three-tier detection
         # For single file mode or dedicated license files, use full content
-        if single_file_mode or self._is_license_file(file_path):
+        if single_file_mode or is_license_file:
             detected = self._detect_license_from_text(content, file_path)
             if detected:
                 licenses.append(detected)
         # For regular files, if they contain license indicators, try both:
         # - License block extraction (for embedded licenses)
         # - Regex detection on full content (for scattered references)
-        elif self._contains_license_text(content):
+        elif self._contains_license_text(content, content_lower):
             # Try extracting a license block first
-            license_block = self._extract_license_block(content)
+            license_block = self._extract_license_block(content, content_lower)
             if license_block:
                 detected = self._detect_license_from_text(license_block, file_path)
                 if detected:
@@ -696,13 +777,13 @@ class LicenseDetector:
 
             # Also try regex patterns on the full content
             # This catches references that aren't in a clear block
-            regex_detected = self._tier3_regex_matching(content, file_path)
+            regex_detected = self._tier3_regex_matching(content, file_path, content_lower)
             if regex_detected:
                 licenses.append(regex_detected)
         # For all other files, still apply regex detection
         # This ensures we catch any license references
         else:
-            regex_detected = self._tier3_regex_matching(content, file_path)
+            regex_detected = self._tier3_regex_matching(content, file_path, content_lower)
             if regex_detected:
                 licenses.append(regex_detected)
 
@@ -718,11 +799,20 @@ class LicenseDetector:
     
     def _is_license_file(self, file_path: Path) -> bool:
         """Check if file is likely a license file."""
-        name_lower = file_path.name.lower()
+        file_name = file_path.name
+        is_license = self._license_file_names.get(file_name)
+        if is_license is None:
+            is_license = self._is_license_file_name(file_name)
+            self._license_file_names[file_name] = is_license
+        return is_license
+
+    def _is_license_file_name(self, file_name: str) -> bool:
+        """Check if a file name looks like a license file."""
+        name_lower = file_name.lower()
         
         # Check patterns
         for pattern in self.license_patterns:
-            if pattern.match(file_path.name):
+            if pattern.match(file_name):
                 return True
         
         # Check common names
@@ -735,26 +825,28 @@ class LicenseDetector:
         
         return False
     
-    def _contains_license_text(self, content: str) -> bool:
+    def _contains_license_text(self, content: str, content_lower: Optional[str] = None) -> bool:
         """Check if content contains license-related text."""
-        content_lower = content.lower()
+        if content_lower is None:
+            content_lower = content.lower()
 
-        # Check for license indicators
-        indicator_count = sum(1 for indicator in self.license_indicators
-                             if indicator in content_lower)
-
-        return indicator_count >= 1  # At least 1 indicator (reduced from 3 for better coverage)
+        # At least 1 indicator (reduced from 3 for better coverage), so stop at the first one
+        return any(indicator in content_lower for indicator in self.license_indicators)
     
-    def _extract_license_block(self, content: str) -> Optional[str]:
+    def _extract_license_block(self, content: str, content_lower: Optional[str] = None) -> Optional[str]:
         """Extract license block from content."""
+        if content_lower is None:
+            content_lower = content.lower()
         lines = content.split('\n')
+        # Lowercasing never adds or removes newlines, so both splits stay index-aligned
+        lines_lower = content_lower.split('\n')
         
         # Look for license header/block
         license_start = -1
         license_end = -1
         
         for i, line in enumerate(lines):
-            line_lower = line.lower()
+            line_lower = lines_lower[i]
             
             # Look for start markers
             if license_start == -1:
@@ -773,7 +865,7 @@ class LicenseDetector:
         
         # Fallback: return first 50 lines if they contain license indicators
         first_lines = '\n'.join(lines[:50])
-        if self._contains_license_text(first_lines):
+        if self._contains_license_text(first_lines, '\n'.join(lines_lower[:50])):
             return first_lines
         
         return None
@@ -1293,75 +1385,78 @@ class LicenseDetector:
         if any(name in file_name for name in ['spdx_licenses.py', 'license_detector.py']):
             return licenses
         
-        for pattern in self.spdx_tag_patterns:
-            matches = pattern.findall(content)
+        # One scan for all tag styles; order hits by pattern, then position,
+        # so the first-seen license wins exactly as with per-pattern scans
+        matches = sorted(self.spdx_tag_pattern.finditer(content),
+                         key=lambda m: (m.lastindex, m.start()))
+
+        for match in matches:
+            # Clean up the match
+            license_id = match.group(match.lastindex).strip()
             
-            for match in matches:
-                # Clean up the match
-                license_id = match.strip()
-                
-                # Skip obvious false positives
-                if self._is_false_positive_license(license_id):
-                    continue
-                
-                # Handle license expressions (AND, OR, WITH)
-                license_ids = self._parse_license_expression(license_id)
-                
-                for lid in license_ids:
-                    if lid not in found_ids:
-                        found_ids.add(lid)
+            # Skip obvious false positives
+            if self._is_false_positive_license(license_id):
+                continue
+            
+            # Handle license expressions (AND, OR, WITH)
+            license_ids = self._parse_license_expression(license_id)
+            
+            for lid in license_ids:
+                if lid not in found_ids:
+                    found_ids.add(lid)
 
-                        # Skip SPDX exceptions (they modify licenses, not standalone)
-                        # Common exceptions end with "-exception" or are known exception IDs
-                        if 'exception' in lid.lower() and not lid.startswith('Font-exception'):
-                            continue
+                    # Skip SPDX exceptions (they modify licenses, not standalone)
+                    # Common exceptions end with "-exception" or are known exception IDs
+                    if 'exception' in lid.lower() and not lid.startswith('Font-exception'):
+                        continue
 
-                        # Normalize license ID
-                        normalized_id = self._normalize_license_id(lid)
+                    # Normalize license ID
+                    normalized_id = self._normalize_license_id(lid)
 
-                        # Get license info
-                        license_info = self.spdx_data.get_license_info(normalized_id)
+                    # Get license info
+                    license_info = self.spdx_data.get_license_info(normalized_id)
 
-                        if license_info:
+                    if license_info:
+                        category, match_type = self._categorize_license(
+                            file_path, DetectionMethod.TAG.value
+                        )
+                        licenses.append(DetectedLicense(
+                            spdx_id=license_info['licenseId'],
+                            name=license_info.get('name', normalized_id),
+                            confidence=1.0,  # High confidence for explicit tags
+                            detection_method=DetectionMethod.TAG.value,
+                            source_file=str(file_path),
+                            category=category,
+                            match_type=match_type
+                        ))
+                    else:
+                        # Only record unknown licenses if they look valid
+                        if self._looks_like_valid_license(normalized_id):
                             category, match_type = self._categorize_license(
                                 file_path, DetectionMethod.TAG.value
                             )
                             licenses.append(DetectedLicense(
-                                spdx_id=license_info['licenseId'],
-                                name=license_info.get('name', normalized_id),
-                                confidence=1.0,  # High confidence for explicit tags
+                                spdx_id=normalized_id,
+                                name=normalized_id,
+                                confidence=0.9,
                                 detection_method=DetectionMethod.TAG.value,
                                 source_file=str(file_path),
                                 category=category,
                                 match_type=match_type
                             ))
-                        else:
-                            # Only record unknown licenses if they look valid
-                            if self._looks_like_valid_license(normalized_id):
-                                category, match_type = self._categorize_license(
-                                    file_path, DetectionMethod.TAG.value
-                                )
-                                licenses.append(DetectedLicense(
-                                    spdx_id=normalized_id,
-                                    name=normalized_id,
-                                    confidence=0.9,
-                                    detection_method=DetectionMethod.TAG.value,
-                                    source_file=str(file_path),
-                                    category=category,
-                                    match_type=match_type
-                                ))
         
         return licenses
     
-    def _detect_license_keywords(self, content: str, file_path: Path) -> List[DetectedLicense]:
+    def _detect_license_keywords(self, content: str, file_path: Path,
+                                 content_lower: Optional[str] = None) -> List[DetectedLicense]:
         """
         Detect license keywords for common base licenses.
         This handles variations like "GPL" for GPL/LGPL/AGPL, "BSD" for any BSD variant.
         Enhanced with fuzzy matching and multi-line pattern support.
         """
-        from typing import Optional
-        import re
         licenses = []
+        if content_lower is None:
+            content_lower = content.lower()
 
         # Base license families with common variations
         base_license_mapping = {
@@ -1531,7 +1626,7 @@ class LicenseDetector:
 
             # Check exact matches first
             for variation in variations:
-                if variation.lower() in content.lower():
+                if variation.lower() in content_lower:
                     # Check context
                     pattern_re = re.compile(re.escape(variation), re.IGNORECASE)
                     match = pattern_re.search(content)
@@ -1785,6 +1880,10 @@ class LicenseDetector:
     def _detect_license_from_text(self, text: str, file_path: Path) -> Optional[DetectedLicense]:
         """
         Detect license from text using four-tier detection.
+
+        Results are memoized on the text digest and the file name facts that
+        categorization depends on, so a header repeated across source files is
+        only matched once; cache hits return a copy pointing at the current file.
         
         Args:
             text: License text
@@ -1793,6 +1892,27 @@ class LicenseDetector:
         Returns:
             Detected license or None
         """
+        digest = hashlib.blake2b(text.encode('utf-8', errors='surrogatepass'), digest_size=16).digest()
+        cache_key = (self._categorization_key(file_path), digest)
+
+        with self._detection_cache_lock:
+            if cache_key in self._detection_cache:
+                self._detection_cache.move_to_end(cache_key)
+                cached = self._detection_cache[cache_key]
+                return replace(cached, source_file=str(file_path)) if cached else None
+
+        detected = self._detect_license_tiers(text, file_path)
+
+        with self._detection_cache_lock:
+            # Store a copy so callers can't modify the cached result
+            self._detection_cache[cache_key] = replace(detected) if detected else None
+            if len(self._detection_cache) > DETECTION_CACHE_SIZE:
+                self._detection_cache.popitem(last=False)
+
+        return detected
+
+    def _detect_license_tiers(self, text: str, file_path: Path) -> Optional[DetectedLicense]:
+        """Run the detection tiers in order and return the first match."""
         # Tier 0: Exact hash matching (SHA-256 and MD5)
         detected = self._tier0_exact_hash(text, file_path)
         if detected:
@@ -1879,36 +1999,36 @@ class LicenseDetector:
         
         # Keep track of all matches to handle ties
         matches = []
+        input_size = len(input_bigrams)
         
         # Compare with known licenses
-        for license_id in self.spdx_data.get_all_license_ids():
-            # Get license text
-            license_text = self.spdx_data.get_license_text(license_id)
-            if not license_text:
-                continue
-            
-            # Normalize and create bigrams
-            normalized_license = self.spdx_data._normalize_text(license_text)
-            license_bigrams = self._create_bigrams(normalized_license)
-            
-            if not license_bigrams:
+        for license_id, license_bigrams in self._get_license_bigrams().items():
+            # Dice-Sørensen is at most 2*min/(min+max), so it can only reach 0.9
+            # when the smaller set has at least 9/11 of the larger set's bigrams
+            license_size = len(license_bigrams)
+            if min(input_size, license_size) * 11 < max(input_size, license_size) * 9:
                 continue
             
             # Calculate Dice-Sørensen coefficient
-            score = self._dice_coefficient(input_bigrams, license_bigrams)
+            # (both sets are non-empty and their sizes are already known)
+            score = (2.0 * len(input_bigrams & license_bigrams)) / (input_size + license_size)
             
             if score >= 0.9:  # Only keep high-scoring matches
                 matches.append((license_id, score))
+                # Identical bigram sets can't be beaten, and ties go to the earlier license
+                if score == 1.0:
+                    break
         
         if not matches:
             return None
         
-        # Sort by score descending
-        matches.sort(key=lambda x: -x[1])
-        best_score = matches[0][1]
+        best_score = max(score for _, score in matches)
         
-        # Get all matches within 1% of best score
-        close_matches = [(lid, score) for lid, score in matches if score >= best_score - 0.01]
+        # Get all matches within 1% of best score, sorted by score descending
+        close_matches = sorted(
+            ((lid, score) for lid, score in matches if score >= best_score - 0.01),
+            key=lambda x: -x[1]
+        )
         
         # Choose the best match, with special handling for known problematic pairs
         best_match = close_matches[0][0]
@@ -1948,22 +2068,26 @@ class LicenseDetector:
         
         return None
     
+    def _get_license_bigrams(self) -> Dict[str, Set[str]]:
+        """Get bigram sets for all known license texts, building them on first use."""
+        if self._license_bigrams is None:
+            license_bigrams = {}
+            for license_id in self.spdx_data.get_all_license_ids():
+                license_text = self.spdx_data.get_license_text(license_id)
+                if not license_text:
+                    continue
+
+                bigrams = self._create_bigrams(self.spdx_data._normalize_text(license_text))
+                if bigrams:
+                    license_bigrams[license_id] = bigrams
+
+            self._license_bigrams = license_bigrams
+        return self._license_bigrams
+
     def _create_bigrams(self, text: str) -> Set[str]:
         """Create character bigrams from text."""
-        bigrams = set()
-        
-        for i in range(len(text) - 1):
-            bigrams.add(text[i:i+2])
-        
-        return bigrams
-    
-    def _dice_coefficient(self, set1: Set[str], set2: Set[str]) -> float:
-        """Calculate Dice-Sørensen coefficient between two sets."""
-        if not set1 or not set2:
-            return 0.0
-        
-        intersection = len(set1 & set2)
-        return (2.0 * intersection) / (len(set1) + len(set2))
+        # Pair each character with its successor; map() keeps the loop in C
+        return set(map(operator.add, text, text[1:]))
     
     def _adjust_regex_confidence(self, raw_score: float, category: str, match_type: str, match_count: int) -> float:
         """
@@ -2005,19 +2129,22 @@ class LicenseDetector:
         else:  # detected category
             return raw_score
     
-    def _tier3_regex_matching(self, text: str, file_path: Path) -> Optional[DetectedLicense]:
+    def _tier3_regex_matching(self, text: str, file_path: Path,
+                              text_lower: Optional[str] = None) -> Optional[DetectedLicense]:
         """
         Tier 3: Regex pattern matching using optimized lookup tables.
 
         Args:
             text: License text
             file_path: Source file
+            text_lower: Pre-lowercased text, if the caller already has it
 
         Returns:
             Detected license or None
         """
         return self.regex_matcher.match_license_patterns(
-            text, file_path, self._categorize_license, self._adjust_regex_confidence
+            text, file_path, self._categorize_license, self._adjust_regex_confidence,
+            text_lower=text_lower
         )
     
     def _is_false_positive_license(self, license_id: str) -> bool:
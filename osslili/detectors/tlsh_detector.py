@@ -11,6 +11,9 @@ from ..core.models import DetectedLicense, DetectionMethod, LicenseCategory
 
 logger = logging.getLogger(__name__)
 
+# File name fragments that mark a TLSH match as a declared license
+LICENSE_NAME_HINTS = ('license', 'licence', 'copying', 'copyright', 'notice')
+
 # Try to import tlsh, make it optional
 try:
     import tlsh
@@ -193,8 +196,7 @@ class TLSHDetector:
                 
                 # Determine category based on filename
                 name_lower = file_path.name.lower()
-                is_license_file = any(pattern in name_lower for pattern in 
-                                     ['license', 'licence', 'copying', 'copyright', 'notice'])
+                is_license_file = any(pattern in name_lower for pattern in LICENSE_NAME_HINTS)
                 category = LicenseCategory.DECLARED.value if is_license_file else LicenseCategory.DETECTED.value
                 
                 return DetectedLicense(
@@ -15,6 +15,70 @@ from ..utils.file_scanner import SafeFileScanner
 
 logger = logging.getLogger(__name__)
 
+# Patterns used by CopyrightExtractor._clean_holder
+_BY_PREFIX_RE = re.compile(r'^\s*(?:by|By)\s+')
+_PLACEHOLDER_RE = re.compile(
+    r'(?:YYYY|yyyy|XXXX|xxxx)'  # Year placeholders
+    r'|(?:NAME|Name|name)'  # Name placeholders
+    r'|(?:AUTHOR|Author|author)$'  # Just "author"
+    r'|(?:HOLDER|Holder|holder)$'  # Just "holder"
+    r'|(?:OWNER|Owner|owner)$'  # Just "owner"
+    r'|(?:YOUR|Your|your)\s+(?:NAME|Name|name)'  # "Your Name"
+    r'|<.*>$'  # Just brackets
+    r'|\[.*\]$'  # Just square brackets
+    r'|\{.*\}$'  # Just curly brackets
+    r'|TODO|TBD|FIXME'  # TODO/TBD/FIXME markers
+)
+_RIGHTS_RESERVED_RE = re.compile(r'\s*[,.]?\s*All rights reserved\.?$', re.IGNORECASE)
+_TRAILING_PUNCT_RE = re.compile(r'\s*[.,;:]+$')
+_NAME_EMAIL_RE = re.compile(r'^([^<]+?)\s*<[^>]+>$')
+_EMAIL_ONLY_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_TRAILING_PARENS_RE = re.compile(r'\s*\([^)]+\)$')
+_INVALID_HOLDER_RE = re.compile(
+    r'^by\s+http'  # "by http://..."
+    r'|^by\s+[a-z]+://'  # "by protocol://..."
+    r'|^\w+\.\w+/'  # domain.com/...
+    r'|^https?://'  # URLs
+    r'|\.invalid'  # Invalid domains
+    r'|^localhost'  # Localhost
+    r'|^127\.0\.0\.1'  # IP addresses
+)
+_TEST_WORD_RE = re.compile(r'\b(?:test|demo|dummy|foo|bar|baz)\b')
+
+# Substrings that mark a holder candidate as code rather than a name
+_CODE_INDICATORS = (
+    'return ', 'function ', 'def ', 'class ', 'import ',
+    'from ', 'if ', 'for ', 'while ', 'const ', 'let ', 'var ',
+    'public ', 'private ', 'static ', 'void ', 'int ', 'string ',
+    'package ', 'module ', 'export ', 'require ', 'use ',
+    '==', '!=', '>=', '<=', '&&', '||', '->', '=>', '::',
+    '${', '#{', '{{', '}}', '/*', '*/', '//'
+)
+
+# Single words that are common programming keywords
+_PROGRAMMING_KEYWORDS = frozenset([
+    'copyright', 'license', 'patent', 'holder', 'owner', 'statement',
+    'information', 'extractor', 'info', 'notice', 'permission',
+    'you', 'your', 'must', 'retain', 'that', 'this', 'with',
+    'evidence', 'found', 'detection', 'patterns', 'regex',
+    'file', 'from', 'name', 'format', 'match', 'future'
+])
+
+# Phrases that are clearly not copyright holders
+_INVALID_PHRASES = (
+    'copyright', 'license', 'patent', 'you must', 'notice',
+    'owner or entity', 'owner that', 'information', 'extraction',
+    'regex match', 'name format', 'years', 'statement',
+    'holder', 'owner', 's_from', 's =', 'info"', 's_found',
+    'evidence', 'by source', 's in ', 'you comply', 'their terms',
+    'in result', 'lines that vary', 'may vary', 'will vary',
+    'varies', 'variable', 'placeholder', 'example', 'sample',
+    'lorem ipsum', 'detector', 'generator', 'scanner', 'analyzer', 'processor'
+)
+
+# Exact test placeholders (not as part of larger names)
+_TEST_PLACEHOLDERS = frozenset(['test', 'demo', 'dummy', 'foo', 'bar', 'baz'])
+
 
 class CopyrightExtractor:
     """Extract copyright information from source code."""
@@ -302,15 +366,15 @@ class CopyrightExtractor:
         return sorted(years) if years else None
     
     def _format_years(self, years: List[int]) -> str:
-        """Format list of years for display."""
+        """Format sorted, unique list of years (as from _parse_years) for display."""
         if not years:
             return ""
         
         if len(years) == 1:
             return str(years[0])
         
-        # Check if consecutive range
-        if years == list(range(years[0], years[-1] + 1)):
+        # Sorted unique years are consecutive exactly when they fill their span
+        if len(years) == years[-1] - years[0] + 1:
             return f"{years[0]}-{years[-1]}"
         
         # Otherwise comma-separated
@@ -323,46 +387,30 @@ class CopyrightExtractor:
         
         # Remove common prefixes
         holder = holder.strip()
-        holder = re.sub(r'^\s*(?:by|By)\s+', '', holder)
+        holder = _BY_PREFIX_RE.sub('', holder)
         
         # Check for placeholder patterns FIRST
-        placeholder_patterns = [
-            r'^(YYYY|yyyy|XXXX|xxxx)',  # Year placeholders
-            r'^(NAME|Name|name)',  # Name placeholders
-            r'^(AUTHOR|Author|author)$',  # Just "author"
-            r'^(HOLDER|Holder|holder)$',  # Just "holder"
-            r'^(OWNER|Owner|owner)$',  # Just "owner"
-            r'^(YOUR|Your|your)\s+(NAME|Name|name)',  # "Your Name"
-            r'^<.*>$',  # Just brackets
-            r'^\[.*\]$',  # Just square brackets
-            r'^\{.*\}$',  # Just curly brackets
-            r'^TODO',  # TODO markers
-            r'^TBD',  # TBD markers
-            r'^FIXME',  # FIXME markers
-        ]
-        
-        for pattern in placeholder_patterns:
-            if re.match(pattern, holder):
-                return ""
+        if _PLACEHOLDER_RE.match(holder):
+            return ""
         
         # Remove "All rights reserved" and similar
-        holder = re.sub(r'\s*[,.]?\s*All rights reserved\.?$', '', holder, flags=re.IGNORECASE)
+        holder = _RIGHTS_RESERVED_RE.sub('', holder)
         
         # Remove trailing punctuation
-        holder = re.sub(r'\s*[.,;:]+$', '', holder)
+        holder = _TRAILING_PUNCT_RE.sub('', holder)
         
         # Extract from email format (Name <email>)
-        email_match = re.match(r'^([^<]+?)\s*<[^>]+>$', holder)
+        email_match = _NAME_EMAIL_RE.match(holder)
         if email_match:
             holder = email_match.group(1).strip()
         
         # Remove standalone email addresses
-        if re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', holder):
+        if _EMAIL_ONLY_RE.match(holder):
             return ""
         
         # Remove trailing parentheses content (but keep if it's the whole thing)
         if '(' in holder and ')' in holder:
-            base = re.sub(r'\s*\([^)]+\)$', '', holder).strip()
+            base = _TRAILING_PARENS_RE.sub('', holder).strip()
             if base:
                 holder = base
         
@@ -374,17 +422,8 @@ class CopyrightExtractor:
             return ""
         
         # Filter out code-like patterns (common false positives)
-        code_indicators = [
-            'return ', 'function ', 'def ', 'class ', 'import ',
-            'from ', 'if ', 'for ', 'while ', 'const ', 'let ', 'var ',
-            'public ', 'private ', 'static ', 'void ', 'int ', 'string ',
-            'package ', 'module ', 'export ', 'require ', 'use ',
-            '==', '!=', '>=', '<=', '&&', '||', '->', '=>', '::',
-            '${', '#{', '{{', '}}', '/*', '*/', '//'
-        ]
-        
         holder_lower = holder.lower()
-        for indicator in code_indicators:
+        for indicator in _CODE_INDICATORS:
             if indicator in holder_lower:
                 return ""
         
@@ -400,20 +439,9 @@ class CopyrightExtractor:
             return ""
         
         # Filter out common invalid patterns
-        invalid_patterns = [
-            r'^by\s+http',  # "by http://..."
-            r'^by\s+[a-z]+://',  # "by protocol://..."
-            r'^\w+\.\w+/',  # domain.com/...
-            r'^https?://',  # URLs
-            r'\.invalid',  # Invalid domains
-            r'^localhost',  # Localhost
-            r'^127\.0\.0\.1',  # IP addresses
-        ]
-        
         holder_lower = holder.lower()
-        for pattern in invalid_patterns:
-            if re.search(pattern, holder_lower):
-                return ""
+        if _INVALID_HOLDER_RE.search(holder_lower):
+            return ""
         
         # Filter out if it contains too many special characters (likely code)
         special_char_count = sum(1 for c in holder if c in '{}[]()<>;:=+-*/%&|^~!@#$')
@@ -421,46 +449,23 @@ class CopyrightExtractor:
             return ""
         
         # Filter out single words that are common programming keywords
-        programming_keywords = [
-            'copyright', 'license', 'patent', 'holder', 'owner', 'statement',
-            'information', 'extractor', 'info', 'notice', 'permission',
-            'you', 'your', 'must', 'retain', 'that', 'this', 'with',
-            'evidence', 'found', 'detection', 'patterns', 'regex',
-            'file', 'from', 'name', 'format', 'match', 'future'
-        ]
-        
-        # Check if it's a single word that's a keyword
         if ' ' not in holder:
-            if holder.lower() in programming_keywords:
+            if holder_lower in _PROGRAMMING_KEYWORDS:
                 return ""
         
-        # Filter out phrases that are clearly not copyright holders
-        invalid_phrases = [
-            'copyright', 'license', 'patent', 'you must', 'notice',
-            'owner or entity', 'owner that', 'information', 'extraction',
-            'regex match', 'name format', 'years', 'statement',
-            'holder', 'owner', 's_from', 's =', 'info"', 's_found',
-            'evidence', 'by source', 's in ', 'you comply', 'their terms',
-            'in result', 'lines that vary', 'may vary', 'will vary',
-            'varies', 'variable', 'placeholder', 'example', 'sample',
-            'lorem ipsum', 'detector', 'generator', 'scanner', 'analyzer', 'processor'
-        ]
-
         # Check for exact matches of test placeholders (not as part of larger names)
         # Only filter if it's EXACTLY these words (case-insensitive)
-        test_placeholders = ['test', 'demo', 'dummy', 'foo', 'bar', 'baz']
-        if holder_lower.strip() in test_placeholders:
+        if holder_lower.strip() in _TEST_PLACEHOLDERS:
             return ""
 
         # For test-related words, only filter if they're standalone words
         # Allow names like "Test Corporation" or "TestCo Inc"
-        test_word_patterns = [r'\btest\b', r'\bdemo\b', r'\bdummy\b', r'\bfoo\b', r'\bbar\b', r'\bbaz\b']
-        for pattern in test_word_patterns:
-            # Check if it's ONLY the test word (not part of a larger name)
-            if re.fullmatch(pattern, holder_lower):
-                return ""
+        # Check if it's ONLY the test word (not part of a larger name)
+        if _TEST_WORD_RE.fullmatch(holder_lower):
+            return ""
 
-        for phrase in invalid_phrases:
+        # Filter out phrases that are clearly not copyright holders
+        for phrase in _INVALID_PHRASES:
             if phrase in holder_lower:
                 return ""
         
@@ -0,0 +1,37 @@
+"""
+Shared helpers for output formatters.
+"""
+
+import json
+from typing import Any
+
+# Try to import orjson, make it optional
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps_json(data: Any, ensure_ascii: bool = False) -> str:
+    """
+    Serialize data as indented JSON.
+    
+    Uses orjson when installed and falls back to the standard library,
+    including for data orjson rejects, such as file paths carrying
+    surrogate-escaped bytes that are not valid UTF-8.
+    
+    Args:
+        data: JSON-serializable data
+        ensure_ascii: Escape non-ASCII characters in the standard library
+            output, so the result can be written in any encoding
+        
+    Returns:
+        JSON string indented by two spaces
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=ensure_ascii)
@@ -2,14 +2,19 @@
 CycloneDX SBOM formatter for standard software bill of materials output.
 """
 
-import json
 import xml.etree.ElementTree as ET
 from datetime import datetime
 from typing import List, Dict, Any
 from pathlib import Path
 import uuid
 
-from ..core.models import DetectionResult
+from ._utils import dumps_json
+from ..core.models import DetectedLicense, DetectionResult
+
+
+def _license_entry(license_info: DetectedLicense) -> Dict[str, Any]:
+    """Build a CycloneDX license entry for a detected license."""
+    return {"license": {"id": license_info.spdx_id}}
 
 
 class CycloneDXFormatter:
@@ -47,14 +52,11 @@ class CycloneDXFormatter:
             }
             
             # Add licenses
-            licenses = []
-            for license_info in result.licenses:
-                if license_info.spdx_id and license_info.spdx_id != "NO-ASSERTION":
-                    licenses.append({
-                        "license": {
-                            "id": license_info.spdx_id
-                        }
-                    })
+            licenses = [
+                _license_entry(license_info)
+                for license_info in result.licenses
+                if license_info.spdx_id and license_info.spdx_id != "NO-ASSERTION"
+            ]
             
             if licenses:
                 component["licenses"] = licenses
@@ -95,7 +97,7 @@ class CycloneDXFormatter:
             "components": components
         }
         
-        return json.dumps(sbom, indent=2, ensure_ascii=False)
+        return dumps_json(sbom)
     
     def _format_xml(self, results: List[DetectionResult]) -> str:
         """Format as CycloneDX XML."""
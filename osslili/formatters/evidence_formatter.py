@@ -2,12 +2,33 @@
 Evidence formatter for showing license detection results with file mappings.
 """
 
-import json
+from collections import Counter
 from typing import List
-from pathlib import Path
 
+from ._utils import dumps_json
 from ..core.models import DetectionResult
 
+# Fallback match type for licenses that do not carry one
+_METHOD_TO_MATCH = {
+    "filename": "license_text",
+    "tag": "spdx_identifier",
+    "regex": "license_reference",
+    "dice-sorensen": "text_similarity",
+    "tlsh": "text_similarity",
+    "hash": "text_similarity",
+    "keyword": "keyword",
+}
+
+# Evidence description per match type
+_DESC_TEMPLATES = {
+    "license_file": "License file contains {sid} license",
+    "spdx_identifier": "SPDX-License-Identifier: {sid} found",
+    "package_metadata": "Package metadata declares {sid} license",
+    "license_reference": "License reference '{sid}' detected",
+    "text_similarity": "Text matches {sid} license ({pct:.1f}% similarity)",
+}
+_DEFAULT_DESC = "Pattern match for {sid}"
+
 
 class EvidenceFormatter:
     """Format attribution results as evidence showing file-to-license mappings."""
@@ -31,16 +52,25 @@ class EvidenceFormatter:
             "scan_results": [],
             "summary": {
                 "total_files_scanned": 0,
-                "declared_licenses": {},
-                "detected_licenses": {},
-                "referenced_licenses": {},
-                "all_licenses": {},
+                "declared_licenses": Counter(),
+                "detected_licenses": Counter(),
+                "referenced_licenses": Counter(),
+                "all_licenses": Counter(),
                 "copyright_holders": [],
                 "copyrights_found": 0
             }
         }
 
         files_seen = set()
+        holders_seen = set()
+
+        # Minimal and summary output only report counts, so their per-file
+        # evidence entries are tallied here instead of being built; any other
+        # level is treated as detailed
+        summary_only = detail_level in ('minimal', 'summary')
+        files_with_licenses = set()
+        license_detections = 0
+        method_counts = Counter()
 
         for result in results:
             scan_result = {
@@ -49,9 +79,49 @@ class EvidenceFormatter:
                 "copyright_evidence": []
             }
 
-            # For detailed mode, don't aggregate - show every individual detection
-            if detail_level in ['detailed', 'full']:
-                # Add each license detection as a separate evidence entry
+            if summary_only:
+                # Minimal/summary modes count each license once per file
+                # Group licenses by source file; the grouping sets the output order
+                license_by_file = {}
+                for license in result.licenses:
+                    source = license.source_file or "unknown"
+                    files_seen.add(source)
+                    license_by_file.setdefault(source, []).append(license)
+
+                for file_path, licenses in license_by_file.items():
+                    seen_licenses = set()
+                    for license in licenses:
+                        spdx_id = license.spdx_id
+                        category = license.category
+
+                        if spdx_id not in seen_licenses:
+                            seen_licenses.add(spdx_id)
+                            files_with_licenses.add(file_path)
+                            license_detections += 1
+                            method_counts[license.detection_method] += 1
+
+                        # Always update summary counts (even for duplicates in aggregated mode)
+                        if category == "declared":
+                            evidence["summary"]["declared_licenses"][spdx_id] += 1
+                        elif category == "detected":
+                            evidence["summary"]["detected_licenses"][spdx_id] += 1
+                        elif category == "referenced":
+                            evidence["summary"]["referenced_licenses"][spdx_id] += 1
+
+                        # Add to overall count
+                        evidence["summary"]["all_licenses"][spdx_id] += 1
+
+                for copyright in result.copyrights:
+                    files_seen.add(copyright.source_file or "unknown")
+                    evidence["summary"]["copyrights_found"] += 1
+
+                    # Add unique copyright holders to summary
+                    if copyright.holder and copyright.holder not in holders_seen:
+                        holders_seen.add(copyright.holder)
+                        evidence["summary"]["copyright_holders"].append(copyright.holder)
+
+            else:
+                # Detailed mode (and unknown levels) show every individual detection
                 for license in result.licenses:
                     source = license.source_file or "unknown"
                     files_seen.add(source)
@@ -60,50 +130,15 @@ class EvidenceFormatter:
                         "detected_license": license.spdx_id,
                         "confidence": round(license.confidence, 3),
                         "detection_method": license.detection_method,
-                        "category": getattr(license, 'category', 'detected')
+                        "category": license.category
                     }
 
-                    # Use the match_type from the license if available
-                    match_type = getattr(license, 'match_type', None)
-                    if match_type:
-                        evidence_entry["match_type"] = match_type
-                    else:
-                        # Fallback to determining match type from method
-                        if license.detection_method == "filename":
-                            evidence_entry["match_type"] = "license_text"
-                        elif license.detection_method == "tag":
-                            evidence_entry["match_type"] = "spdx_identifier"
-                        elif license.detection_method == "regex":
-                            evidence_entry["match_type"] = "license_reference"
-                        elif license.detection_method in ["dice-sorensen", "tlsh", "hash"]:
-                            evidence_entry["match_type"] = "text_similarity"
-                        elif license.detection_method == "keyword":
-                            evidence_entry["match_type"] = "keyword"
-                        else:
-                            evidence_entry["match_type"] = "pattern_match"
-
-                    # Generate description based on match type
-                    match_type = evidence_entry.get("match_type", "pattern_match")
-                    if match_type == "license_file":
-                        evidence_entry["description"] = f"License file contains {license.spdx_id} license"
-                    elif match_type == "spdx_identifier":
-                        evidence_entry["description"] = f"SPDX-License-Identifier: {license.spdx_id} found"
-                    elif match_type == "package_metadata":
-                        evidence_entry["description"] = f"Package metadata declares {license.spdx_id} license"
-                    elif match_type == "license_reference":
-                        evidence_entry["description"] = f"License reference '{license.spdx_id}' detected"
-                    elif match_type == "text_similarity":
-                        evidence_entry["description"] = f"Text matches {license.spdx_id} license ({license.confidence*100:.1f}% similarity)"
-                    elif match_type == "exact_hash":
-                        evidence_entry["description"] = f"Pattern match for {license.spdx_id}"
-                    else:
-                        evidence_entry["description"] = f"Pattern match for {license.spdx_id}"
-
-                    # Add line/offset information if available
-                    if hasattr(license, 'line_number'):
-                        evidence_entry["line_number"] = license.line_number
-                    if hasattr(license, 'byte_offset'):
-                        evidence_entry["byte_offset"] = license.byte_offset
+                    # Use the match_type from the license, falling back to the method
+                    match_type = license.match_type or _METHOD_TO_MATCH.get(license.detection_method, "pattern_match")
+                    evidence_entry["match_type"] = match_type
+                    evidence_entry["description"] = _DESC_TEMPLATES.get(match_type, _DEFAULT_DESC).format(
+                        sid=license.spdx_id, pct=license.confidence * 100
+                    )
 
                     scan_result["license_evidence"].append(evidence_entry)
 
@@ -113,21 +148,13 @@ class EvidenceFormatter:
 
                     # Add to category-specific counts
                     if category == "declared":
-                        if spdx_id not in evidence["summary"]["declared_licenses"]:
-                            evidence["summary"]["declared_licenses"][spdx_id] = 0
                         evidence["summary"]["declared_licenses"][spdx_id] += 1
                     elif category == "detected":
-                        if spdx_id not in evidence["summary"]["detected_licenses"]:
-                            evidence["summary"]["detected_licenses"][spdx_id] = 0
                         evidence["summary"]["detected_licenses"][spdx_id] += 1
                     elif category == "referenced":
-                        if spdx_id not in evidence["summary"]["referenced_licenses"]:
-                            evidence["summary"]["referenced_licenses"][spdx_id] = 0
                         evidence["summary"]["referenced_licenses"][spdx_id] += 1
 
                     # Add to overall count
-                    if spdx_id not in evidence["summary"]["all_licenses"]:
-                        evidence["summary"]["all_licenses"][spdx_id] = 0
                     evidence["summary"]["all_licenses"][spdx_id] += 1
 
                 # Add copyrights without aggregation in detailed mode
@@ -143,133 +170,10 @@ class EvidenceFormatter:
                     evidence["summary"]["copyrights_found"] += 1
 
                     # Add unique copyright holders to summary
-                    if copyright.holder and copyright.holder not in evidence["summary"]["copyright_holders"]:
+                    if copyright.holder and copyright.holder not in holders_seen:
+                        holders_seen.add(copyright.holder)
                         evidence["summary"]["copyright_holders"].append(copyright.holder)
 
-            else:
-                # For minimal/summary modes, aggregate as before
-                # Group licenses by source file
-                license_by_file = {}
-                for license in result.licenses:
-                    source = license.source_file or "unknown"
-                    files_seen.add(source)
-                    if source not in license_by_file:
-                        license_by_file[source] = []
-                    license_by_file[source].append({
-                        "spdx_id": license.spdx_id,
-                        "confidence": round(license.confidence, 3),
-                        "method": license.detection_method,
-                        "category": getattr(license, 'category', 'detected'),
-                        "match_type": getattr(license, 'match_type', None)
-                    })
-
-                # Format license evidence (aggregated)
-                for file_path, licenses in license_by_file.items():
-                    # Create one evidence entry per unique license per file
-                    seen_licenses = set()
-                    for lic in licenses:
-                        # Only add if we haven't seen this license for this file yet
-                        if lic["spdx_id"] not in seen_licenses:
-                            seen_licenses.add(lic["spdx_id"])
-                            evidence_entry = {
-                                "file": file_path,
-                                "detected_license": lic["spdx_id"],
-                                "confidence": lic["confidence"],
-                                "detection_method": lic["method"],
-                                "category": lic["category"]
-                            }
-
-                            # Use the match_type from the license if available
-                            if lic.get("match_type"):
-                                evidence_entry["match_type"] = lic["match_type"]
-                            else:
-                                # Fallback to determining match type from method
-                                file_name = Path(file_path).name.lower() if file_path != "unknown" else "unknown"
-                                if lic["method"] == "filename":
-                                    evidence_entry["match_type"] = "license_text"
-                                elif lic["method"] == "tag":
-                                    evidence_entry["match_type"] = "spdx_identifier"
-                                elif lic["method"] == "regex":
-                                    evidence_entry["match_type"] = "license_reference"
-                                elif lic["method"] in ["dice-sorensen", "tlsh", "hash"]:
-                                    evidence_entry["match_type"] = "text_similarity"
-                                else:
-                                    evidence_entry["match_type"] = "pattern_match"
-
-                            # Generate description based on match type
-                            match_type = evidence_entry["match_type"]
-                            if match_type == "license_file":
-                                evidence_entry["description"] = f"License file contains {lic['spdx_id']} license"
-                            elif match_type == "spdx_identifier":
-                                evidence_entry["description"] = f"SPDX-License-Identifier: {lic['spdx_id']} found"
-                            elif match_type == "package_metadata":
-                                evidence_entry["description"] = f"Package metadata declares {lic['spdx_id']} license"
-                            elif match_type == "license_reference":
-                                evidence_entry["description"] = f"License reference '{lic['spdx_id']}' detected"
-                            elif match_type == "text_similarity":
-                                evidence_entry["description"] = f"Text matches {lic['spdx_id']} license ({lic['confidence']*100:.1f}% similarity)"
-                            else:
-                                evidence_entry["description"] = f"Pattern match for {lic['spdx_id']}"
-
-                            scan_result["license_evidence"].append(evidence_entry)
-
-                        # Always update summary counts (even for duplicates in aggregated mode)
-                        category = lic["category"]
-                        spdx_id = lic["spdx_id"]
-
-                        # Add to category-specific counts
-                        if category == "declared":
-                            if spdx_id not in evidence["summary"]["declared_licenses"]:
-                                evidence["summary"]["declared_licenses"][spdx_id] = 0
-                            evidence["summary"]["declared_licenses"][spdx_id] += 1
-                        elif category == "detected":
-                            if spdx_id not in evidence["summary"]["detected_licenses"]:
-                                evidence["summary"]["detected_licenses"][spdx_id] = 0
-                            evidence["summary"]["detected_licenses"][spdx_id] += 1
-                        elif category == "referenced":
-                            if spdx_id not in evidence["summary"]["referenced_licenses"]:
-                                evidence["summary"]["referenced_licenses"][spdx_id] = 0
-                            evidence["summary"]["referenced_licenses"][spdx_id] += 1
-
-                        # Add to overall count
-                        if spdx_id not in evidence["summary"]["all_licenses"]:
-                            evidence["summary"]["all_licenses"][spdx_id] = 0
-                        evidence["summary"]["all_licenses"][spdx_id] += 1
-
-                # Group copyrights by source file
-                copyright_by_file = {}
-                for copyright in result.copyrights:
-                    source = copyright.source_file or "unknown"
-                    files_seen.add(source)
-                    if source not in copyright_by_file:
-                        copyright_by_file[source] = []
-                    copyright_by_file[source].append({
-                        "holder": copyright.holder,
-                        "years": copyright.years,
-                        "statement": copyright.statement
-                    })
-
-                # Format copyright evidence (aggregated)
-                for file_path, copyrights in copyright_by_file.items():
-                    seen_copyrights = set()
-                    for cp in copyrights:
-                        # Create unique key for copyright
-                        cp_key = f"{cp['holder']}_{cp['years']}"
-                        if cp_key not in seen_copyrights:
-                            seen_copyrights.add(cp_key)
-                            scan_result["copyright_evidence"].append({
-                                "file": file_path,
-                                "holder": cp["holder"],
-                                "years": cp["years"],
-                                "statement": cp["statement"]
-                            })
-
-                        evidence["summary"]["copyrights_found"] += 1
-
-                        # Add unique copyright holders to summary
-                        if cp["holder"] and cp["holder"] not in evidence["summary"]["copyright_holders"]:
-                            evidence["summary"]["copyright_holders"].append(cp["holder"])
-
             # Add errors if any
             if result.errors:
                 scan_result["errors"] = result.errors
@@ -279,47 +183,37 @@ class EvidenceFormatter:
         # Update file count based on actual files seen
         evidence["summary"]["total_files_scanned"] = len(files_seen)
 
+        # Hand plain dicts to the serializer
+        for key in ("declared_licenses", "detected_licenses", "referenced_licenses", "all_licenses"):
+            evidence["summary"][key] = dict(evidence["summary"][key])
+
         # Apply detail level filtering
-        evidence = self._apply_detail_filtering(evidence, detail_level)
+        evidence = self._apply_detail_filtering(
+            evidence, detail_level, len(files_with_licenses), license_detections, method_counts
+        )
 
-        return json.dumps(evidence, indent=2)
+        # Escape non-ASCII on the fallback path as the evidence output always
+        # has, so paths with undecodable bytes still serialize
+        return dumps_json(evidence, ensure_ascii=True)
 
-    def _apply_detail_filtering(self, evidence: dict, detail_level: str) -> dict:
+    def _apply_detail_filtering(self, evidence: dict, detail_level: str, files_with_licenses: int,
+                                license_detections: int, method_counts: Counter) -> dict:
         """Apply detail level filtering to evidence data."""
-        if detail_level == 'minimal':
+        if detail_level in ('minimal', 'summary'):
             # Only keep summary license and copyright counts
+            summary = evidence["summary"]
             filtered = {
-                "summary": {
-                    "total_files_scanned": evidence["summary"]["total_files_scanned"],
-                    "files_with_licenses": len(set(e["file"] for r in evidence["scan_results"] for e in r["license_evidence"])),
-                    "license_breakdown": evidence["summary"]["all_licenses"],
-                    "total_license_detections": sum(len(r["license_evidence"]) for r in evidence["scan_results"]),
-                    "copyrights_found": evidence["summary"]["copyrights_found"],
-                    "unique_copyright_holders": len(evidence["summary"]["copyright_holders"])
-                }
-            }
-            return filtered
-
-        elif detail_level == 'summary':
-            # Add detection method counts
-            method_counts = {}
-            for result in evidence["scan_results"]:
-                for lic_evidence in result["license_evidence"]:
-                    method = lic_evidence["detection_method"]
-                    method_counts[method] = method_counts.get(method, 0) + 1
-
-            filtered = {
-                "summary": {
-                    "total_files_scanned": evidence["summary"]["total_files_scanned"],
-                    "files_with_licenses": len(set(e["file"] for r in evidence["scan_results"] for e in r["license_evidence"])),
-                    "license_breakdown": evidence["summary"]["all_licenses"],
-                    "total_license_detections": sum(len(r["license_evidence"]) for r in evidence["scan_results"]),
-                    "detection_methods": method_counts,
-                    "copyrights_found": evidence["summary"]["copyrights_found"],
-                    "unique_copyright_holders": len(evidence["summary"]["copyright_holders"])
-                }
+                "total_files_scanned": summary["total_files_scanned"],
+                "files_with_licenses": files_with_licenses,
+                "license_breakdown": summary["all_licenses"],
+                "total_license_detections": license_detections
             }
-            return filtered
+            if detail_level == 'summary':
+                # Add detection method counts
+                filtered["detection_methods"] = dict(method_counts)
+            filtered["copyrights_found"] = summary["copyrights_found"]
+            filtered["unique_copyright_holders"] = len(summary["copyright_holders"])
+            return {"summary": filtered}
 
         elif detail_level in ['detailed', 'full']:
             # Return everything without filtering for detailed mode
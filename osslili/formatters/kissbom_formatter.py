@@ -2,10 +2,10 @@
 KissBOM formatter for simple JSON output with packages and licenses.
 """
 
-import json
 from typing import List, Dict, Any
 from pathlib import Path
 
+from ._utils import dumps_json
 from ..core.models import DetectionResult
 
 
@@ -60,4 +60,4 @@ class KissBOMFormatter:
             "packages": packages
         }
         
-        return json.dumps(kissbom, indent=2, ensure_ascii=False)
\ No newline at end of file
+        return dumps_json(kissbom)
\ No newline at end of file
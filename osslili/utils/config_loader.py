@@ -2,8 +2,8 @@
 Configuration loader with YAML support.
 """
 
-import os
 import logging
+from dataclasses import fields
 from pathlib import Path
 from typing import Optional, Dict, Any
 
@@ -11,8 +11,17 @@ import yaml
 
 from ..core.models import Config
 
+# Use the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 logger = logging.getLogger(__name__)
 
+# Settable Config fields, so config keys never match methods or other attributes
+CONFIG_FIELDS = frozenset(f.name for f in fields(Config))
+
 
 class ConfigLoader:
     """Load and manage configuration from various sources."""
@@ -29,10 +38,14 @@ class ConfigLoader:
             Config object with loaded settings
         """
         try:
-            with open(config_path, 'r') as f:
-                data = yaml.safe_load(f)
+            with open(config_path, 'rb') as f:
+                data = yaml.load(f, Loader=YamlLoader) or {}
+            if not isinstance(data, dict):
+                raise ValueError(
+                    f"Configuration must be a mapping of settings, got {type(data).__name__}"
+                )
             
-            return ConfigLoader.create_config(data or {})
+            return ConfigLoader.create_config(data)
         
         except FileNotFoundError:
             logger.error(f"Configuration file not found: {config_path}")
@@ -59,15 +72,14 @@ class ConfigLoader:
         
         # Update config with provided data
         for key, value in data.items():
-            if hasattr(config, key):
-                # Special handling for certain fields
-                if key == 'license_filename_patterns' and isinstance(value, list):
-                    config.license_filename_patterns = value
-                elif key == 'custom_aliases' and isinstance(value, dict):
-                    config.custom_aliases.update(value)
-                else:
-                    setattr(config, key, value)
-            else:
+            if key not in CONFIG_FIELDS:
                 logger.warning(f"Unknown configuration key: {key}")
+                continue
+            
+            # Special handling for certain fields
+            if key == 'custom_aliases' and isinstance(value, dict):
+                config.custom_aliases.update(value)
+            else:
+                setattr(config, key, value)
         
         return config
\ No newline at end of file
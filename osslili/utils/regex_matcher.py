@@ -68,7 +68,8 @@ class RegexPatternMatcher:
             self.compiled_reference_patterns = []
 
     def match_license_patterns(self, text: str, file_path: Path,
-                             categorize_func, adjust_confidence_func) -> Optional[DetectedLicense]:
+                             categorize_func, adjust_confidence_func,
+                             text_lower: Optional[str] = None) -> Optional[DetectedLicense]:
         """
         Match license patterns against text using lookup table approach.
 
@@ -77,11 +78,13 @@ class RegexPatternMatcher:
             file_path: Source file path
             categorize_func: Function to categorize license
             adjust_confidence_func: Function to adjust confidence
+            text_lower: Pre-lowercased text, computed here if not provided
 
         Returns:
             Detected license or None
         """
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
 
         # Iterate through license patterns in priority order
         for license_config in self.license_patterns:
@@ -0,0 +1,112 @@
+"""Tests for YAML configuration loading."""
+
+import pytest
+import tempfile
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from osslili.cli import load_config, main
+from osslili.utils.config_loader import ConfigLoader
+
+
+class TestConfigLoader:
+    """Test loading configuration files."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.config_file = self.test_dir / "config.yaml"
+
+    def test_load_known_keys(self):
+        """Known keys are applied and custom aliases extend the defaults."""
+        self.config_file.write_text(
+            "similarity_threshold: 0.9\n"
+            "thread_count: 2\n"
+            "custom_aliases:\n"
+            "  My License: MIT\n"
+        )
+
+        config = ConfigLoader.load_from_file(str(self.config_file))
+
+        assert config.similarity_threshold == 0.9
+        assert config.thread_count == 2
+        assert config.custom_aliases["My License"] == "MIT"
+        assert config.custom_aliases["GPLv3"] == "GPL-3.0"
+
+    def test_unknown_keys_and_methods_are_ignored(self):
+        """Keys that are not Config fields, including method names, are skipped."""
+        self.config_file.write_text("unknown_option: 1\napply_fast_mode: 1\n")
+
+        config = ConfigLoader.load_from_file(str(self.config_file))
+
+        assert not hasattr(config, "unknown_option")
+        assert callable(config.apply_fast_mode)
+
+    def test_empty_file_gives_defaults(self):
+        """An empty file loads the default configuration."""
+        self.config_file.write_text("")
+
+        config = ConfigLoader.load_from_file(str(self.config_file))
+
+        assert config.thread_count == 4
+
+    def test_non_mapping_is_rejected(self):
+        """A YAML document that is not a mapping raises an error."""
+        self.config_file.write_text("- thread_count\n- 2\n")
+
+        with pytest.raises(ValueError):
+            ConfigLoader.load_from_file(str(self.config_file))
+
+    def test_reload_sees_changes_and_isolates_results(self):
+        """Edited files are read again and loaded configs do not share state."""
+        self.config_file.write_text("license_filename_patterns: [LICENSE*]\n")
+
+        first = ConfigLoader.load_from_file(str(self.config_file))
+        first.license_filename_patterns.append("COPYING*")
+        second = ConfigLoader.load_from_file(str(self.config_file))
+        assert second.license_filename_patterns == ["LICENSE*"]
+
+        self.config_file.write_text("license_filename_patterns: [NOTICE*]\n")
+
+        third = ConfigLoader.load_from_file(str(self.config_file))
+        assert third.license_filename_patterns == ["NOTICE*"]
+
+
+class TestCliLoadConfig:
+    """Test configuration loading through the CLI."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.config_file = self.test_dir / "config.yaml"
+
+    def test_custom_aliases_extend_defaults(self):
+        """Custom aliases from the CLI config are merged into the defaults."""
+        self.config_file.write_text("custom_aliases:\n  My License: MIT\n")
+
+        config = load_config(str(self.config_file))
+
+        assert config.custom_aliases["My License"] == "MIT"
+        assert config.custom_aliases["GPLv3"] == "GPL-3.0"
+
+    def test_empty_file_gives_defaults(self):
+        """An empty config file loads the defaults without a warning."""
+        self.config_file.write_text("")
+        (self.test_dir / "main.py").write_text("x = 1\n")
+
+        result = CliRunner().invoke(main, [str(self.test_dir), "--config", str(self.config_file)])
+
+        assert result.exit_code == 0
+        assert "Failed to load config" not in result.output
+
+    def test_non_mapping_warns_and_gives_defaults(self, capsys):
+        """A config file that is not a mapping falls back to the defaults."""
+        self.config_file.write_text("- thread_count\n- 2\n")
+
+        config = load_config(str(self.config_file))
+
+        assert config.thread_count == 4
+        output = capsys.readouterr().out
+        assert "must be a mapping" in output
+        assert "NoneType" not in output
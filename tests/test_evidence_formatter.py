@@ -0,0 +1,80 @@
+"""Tests for evidence formatter detail levels."""
+
+import json
+
+from osslili.core.models import CopyrightInfo, DetectedLicense, DetectionResult
+from osslili.formatters.evidence_formatter import EvidenceFormatter
+
+
+def make_result():
+    """Build a result with duplicate licenses in the same file."""
+    result = DetectionResult(path="/pkg")
+    result.licenses = [
+        DetectedLicense(spdx_id="MIT", name="MIT", confidence=1.0, detection_method="tag",
+                        source_file="/pkg/a.py", category="detected"),
+        DetectedLicense(spdx_id="MIT", name="MIT", confidence=1.0, detection_method="tag",
+                        source_file="/pkg/a.py", category="detected"),
+        DetectedLicense(spdx_id="MIT", name="MIT", confidence=0.97, detection_method="dice-sorensen",
+                        source_file="/pkg/LICENSE", category="declared"),
+        DetectedLicense(spdx_id="Apache-2.0", name="Apache", confidence=0.9, detection_method="regex",
+                        source_file="/pkg/a.py", category="referenced"),
+    ]
+    result.copyrights = [
+        CopyrightInfo(holder="Jane Doe", years=[2024], statement="Copyright 2024 Jane Doe",
+                      source_file="/pkg/LICENSE"),
+        CopyrightInfo(holder="Jane Doe", years=[2024], statement="Copyright 2024 Jane Doe",
+                      source_file="/pkg/a.py"),
+    ]
+    return result
+
+
+class TestEvidenceDetailLevels:
+    """Test summary counts for each detail level."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.formatter = EvidenceFormatter()
+
+    def test_minimal_counts_unique_license_per_file(self):
+        """Minimal output counts one detection per license per file."""
+        summary = json.loads(self.formatter.format([make_result()], "minimal"))["summary"]
+
+        assert summary["total_files_scanned"] == 2
+        assert summary["files_with_licenses"] == 2
+        assert summary["total_license_detections"] == 3
+        assert summary["license_breakdown"] == {"MIT": 3, "Apache-2.0": 1}
+        assert summary["copyrights_found"] == 2
+        assert summary["unique_copyright_holders"] == 1
+        assert "detection_methods" not in summary
+
+    def test_summary_adds_detection_methods(self):
+        """Summary output adds per-method counts of the aggregated detections."""
+        evidence = json.loads(self.formatter.format([make_result()], "summary"))
+
+        assert "scan_results" not in evidence
+        assert evidence["summary"]["detection_methods"] == {"tag": 1, "regex": 1, "dice-sorensen": 1}
+
+    def test_detailed_keeps_every_detection(self):
+        """Detailed output lists every detection without aggregation."""
+        evidence = json.loads(self.formatter.format([make_result()], "detailed"))
+
+        assert len(evidence["scan_results"][0]["license_evidence"]) == 4
+        assert len(evidence["scan_results"][0]["copyright_evidence"]) == 2
+        assert evidence["summary"]["declared_licenses"] == {"MIT": 1}
+
+    def test_unknown_level_falls_back_to_detailed(self):
+        """Unrecognised detail levels produce the detailed output."""
+        result = make_result()
+
+        assert self.formatter.format([result], "verbose") == self.formatter.format([result], "detailed")
+
+    def test_undecodable_path_serializes(self):
+        """A surrogate-escaped source file is written as an escaped string."""
+        result = make_result()
+        result.licenses[0].source_file = "/pkg/caf\udce9/LICENSE"
+
+        output = self.formatter.format([result], "detailed")
+        output.encode("utf-8")
+
+        entry = json.loads(output)["scan_results"][0]["license_evidence"][0]
+        assert entry["file"] == "/pkg/caf\udce9/LICENSE"
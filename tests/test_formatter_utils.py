@@ -0,0 +1,34 @@
+"""Tests for shared formatter helpers."""
+
+import json
+
+from osslili.formatters import _utils
+from osslili.formatters._utils import dumps_json
+
+
+class TestDumpsJson:
+    """Test JSON serialization used by the formatters."""
+
+    def test_matches_standard_library_output(self):
+        """Output is indented by two spaces and keeps non-ASCII text."""
+        data = {"holder": "José Müller", "years": [2023, 2024], "nested": {"ok": True}}
+
+        assert dumps_json(data) == json.dumps(data, indent=2, ensure_ascii=False)
+
+    def test_non_string_keys_are_written_as_strings(self):
+        """Non-string keys are stringified as the standard library does."""
+        assert json.loads(dumps_json({1: "a", 2.5: "b"})) == {"1": "a", "2.5": "b"}
+
+    def test_surrogate_escaped_path_falls_back_to_standard_library(self):
+        """Paths with undecodable bytes serialize instead of raising."""
+        data = {"file": "caf\udce9/LICENSE"}
+
+        assert dumps_json(data, ensure_ascii=True) == json.dumps(data, indent=2)
+
+    def test_ensure_ascii_without_orjson(self, monkeypatch):
+        """The standard library path honours ensure_ascii."""
+        monkeypatch.setattr(_utils, "ORJSON_AVAILABLE", False)
+        data = {"file": "caf\udce9/LICENSE", "holder": "José"}
+
+        assert dumps_json(data, ensure_ascii=True) == json.dumps(data, indent=2)
+        assert dumps_json({"holder": "José"}) == json.dumps({"holder": "José"}, indent=2, ensure_ascii=False)
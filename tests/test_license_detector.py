@@ -0,0 +1,191 @@
+"""Tests for license detector internals."""
+
+import tempfile
+from pathlib import Path
+
+from osslili.core.models import Config
+from osslili.detectors.license_detector import LICENSE_PREFIX_SIZE, LicenseDetector
+
+
+MIT_TEXT = """MIT License
+
+Copyright (c) 2024 Test Author
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+"""
+
+
+class TestDetectionCache:
+    """Test memoization of text detection results."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.detector = LicenseDetector(Config())
+        self.test_dir = Path(tempfile.mkdtemp())
+
+    def test_identical_text_reuses_result(self):
+        """Duplicate license files get the same license with their own source file."""
+        first = self.test_dir / "a" / "LICENSE"
+        second = self.test_dir / "b" / "LICENSE"
+
+        detected_first = self.detector._detect_license_from_text(MIT_TEXT, first)
+        detected_second = self.detector._detect_license_from_text(MIT_TEXT, second)
+
+        assert detected_first is not None
+        assert detected_second is not None
+        assert detected_first.spdx_id == detected_second.spdx_id == "MIT"
+        assert detected_first.source_file == str(first)
+        assert detected_second.source_file == str(second)
+        assert detected_first is not detected_second
+        assert len(self.detector._detection_cache) == 1
+
+    def test_cached_result_not_affected_by_caller_changes(self):
+        """Mutating a returned result does not leak into later cache hits."""
+        path = self.test_dir / "LICENSE"
+
+        detected = self.detector._detect_license_from_text(MIT_TEXT, path)
+        detected.match_type = "changed"
+
+        again = self.detector._detect_license_from_text(MIT_TEXT, path)
+        assert again.match_type != "changed"
+
+    def test_source_files_sharing_a_header_hit_the_cache(self, monkeypatch):
+        """The same header in several source files is only matched once."""
+        calls = []
+        original = self.detector._detect_license_tiers
+
+        def tracking_tiers(*args, **kwargs):
+            calls.append(args)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(self.detector, "_detect_license_tiers", tracking_tiers)
+        first = self.detector._detect_license_from_text(MIT_TEXT, self.test_dir / "a.py")
+        second = self.detector._detect_license_from_text(MIT_TEXT, self.test_dir / "b.py")
+
+        assert len(calls) == 1
+        assert len(self.detector._detection_cache) == 1
+        assert second.source_file == str(self.test_dir / "b.py")
+        assert second.category == first.category
+
+    def test_license_file_and_source_file_are_categorized_separately(self):
+        """Same text in a license file and a source file does not share a result."""
+        self.detector._detect_license_from_text(MIT_TEXT, self.test_dir / "LICENSE")
+        self.detector._detect_license_from_text(MIT_TEXT, self.test_dir / "main.py")
+
+        assert len(self.detector._detection_cache) == 2
+
+
+class TestLargeFilePrefix:
+    """Test the prefix check for large non-license files."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.detector = LicenseDetector(Config())
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.filler = "x = 1\n" * 20000  # ~120KB without license text
+
+    def test_large_file_without_license_text_is_skipped(self, monkeypatch):
+        """Only the prefix is read when it has no license indicators."""
+        big_file = self.test_dir / "generated.py"
+        big_file.write_text(self.filler)
+
+        calls = []
+        original = self.detector.input_processor.read_text_file
+
+        def tracking_read(path, max_size=None):
+            calls.append(max_size)
+            return original(path, max_size=max_size)
+
+        monkeypatch.setattr(self.detector.input_processor, "read_text_file", tracking_read)
+
+        assert self.detector._detect_licenses_in_file(big_file) == []
+        assert calls == [LICENSE_PREFIX_SIZE]
+
+    def test_large_file_with_license_header_is_scanned(self):
+        """A license header at the top still gets the whole file scanned."""
+        big_file = self.test_dir / "module.py"
+        big_file.write_text("# SPDX-License-Identifier: Apache-2.0\n" + self.filler)
+
+        licenses = self.detector._detect_licenses_in_file(big_file)
+        assert "Apache-2.0" in [l.spdx_id for l in licenses]
+
+    def test_very_large_file_with_trailing_license_is_scanned(self):
+        """Files sampled at both ends still find a license only at the end."""
+        big_file = self.test_dir / "app.js"
+        with open(big_file, "w") as f:
+            for _ in range(100):
+                f.write(self.filler)  # ~12MB without license text
+            f.write("/* SPDX-License-Identifier: MIT */\n")
+
+        licenses = self.detector._detect_licenses_in_file(big_file)
+        assert "MIT" in [l.spdx_id for l in licenses]
+
+
+class TestSpdxTags:
+    """Test each SPDX tag style handled by the combined tag pattern."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.detector = LicenseDetector(Config())
+
+    def detect_ids(self, content, file_name="main.js"):
+        """Return the license IDs tagged in content, in detection order."""
+        return [lic.spdx_id for lic in self.detector._detect_spdx_tags(content, Path(file_name))]
+
+    def test_spdx_identifier_in_c_comment(self):
+        """SPDX line stops before a closing C comment marker."""
+        assert self.detect_ids("/* SPDX-License-Identifier: MIT */\n") == ["MIT"]
+
+    def test_spdx_identifier_in_html_comment(self):
+        """SPDX line stops before a closing HTML comment marker."""
+        assert self.detect_ids("<!-- SPDX-License-Identifier: Apache-2.0 -->\n") == ["Apache-2.0"]
+
+    def test_license_expression(self):
+        """Python METADATA License-Expression is detected."""
+        assert self.detect_ids("License-Expression: BSD-3-Clause\n") == ["BSD-3-Clause"]
+
+    def test_package_json_license(self):
+        """package.json license field is detected."""
+        assert self.detect_ids('{"license": "ISC"}') == ["ISC"]
+
+    def test_package_json_licenses_type(self):
+        """package.json licenses array type field is detected."""
+        assert self.detect_ids('{"licenses": [{"type": "MPL-2.0"}]}') == ["MPL-2.0"]
+
+    def test_pyproject_license_table(self):
+        """pyproject.toml license table text is detected."""
+        assert self.detect_ids('license = {text = "Zlib"}\n') == ["Zlib"]
+
+    def test_pyproject_license_string(self):
+        """pyproject.toml license string is detected."""
+        assert self.detect_ids('license = "EPL-2.0"\n') == ["EPL-2.0"]
+
+    def test_license_field(self):
+        """Line-leading License: field is detected."""
+        assert self.detect_ids("License: LGPL-2.1\n") == ["LGPL-2.1"]
+
+    def test_jsdoc_license(self):
+        """JSDoc @license tag is detected."""
+        assert self.detect_ids(" * @license Unlicense\n") == ["Unlicense"]
+
+    def test_licensed_under(self):
+        """Licensed under phrase is detected."""
+        assert self.detect_ids("Licensed under the Apache-2.0 License\n") == ["Apache-2.0"]
+
+    def test_earlier_pattern_wins_over_earlier_position(self):
+        """Hits are ordered by pattern before position, as with per-pattern scans."""
+        content = '{"license": "Apache-2.0"}\n// SPDX-License-Identifier: MIT\n'
+
+        assert self.detect_ids(content) == ["MIT", "Apache-2.0"]